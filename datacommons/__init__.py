@@ -26,9 +26,14 @@ from datacommons.query import query
 
 # Data Commons Python API
 from datacommons.core import get_property_labels, get_property_values, get_triples
+
+# Async counterparts of the core node operations (Python 3 only).
+import sys
+if sys.version_info[0] >= 3:
+  from datacommons.async_core import aget_property_labels, aget_property_values, aget_triples
 from datacommons.places import get_places_in, get_related_places, get_stats
 from datacommons.populations import get_populations, get_observations, get_pop_obs, get_place_obs
 from datacommons.stat_vars import get_stat_value, get_stat_series, get_stat_all
 
 # Other utilities
-from datacommons.utils import set_api_key
+from datacommons.utils import set_api_key, set_response_cache_enabled
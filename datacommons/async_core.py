@@ -0,0 +1,82 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Data Commons Python API Async Core.
+
+Provides coroutine counterparts of the core node operations so that many
+independent calls can run concurrently (total wall time approaches the
+slowest single call rather than the sum of all calls). Each coroutine
+delegates to its synchronous counterpart in :any:`datacommons.core` on an
+executor thread, so results, errors and request formats are identical.
+
+This module requires Python 3 and is only exported by the package there.
+"""
+
+import asyncio
+import functools
+
+import datacommons.core as core
+
+
+async def _run_blocking(func, *args, **kwargs):
+  """ Runs a blocking API call on the event loop's default executor. """
+  try:
+    loop = asyncio.get_running_loop()
+  except AttributeError:
+    # Python < 3.7
+    loop = asyncio.get_event_loop()
+  return await loop.run_in_executor(
+    None, functools.partial(func, *args, **kwargs))
+
+
+async def aget_property_labels(dcids, out=True):
+  """ Async version of :any:`datacommons.core.get_property_labels`.
+
+  Accepts the same arguments and returns the same :obj:`dict`.
+  """
+  return await _run_blocking(core.get_property_labels, dcids, out=out)
+
+
+async def aget_property_values(dcids,
+                               prop,
+                               out=True,
+                               value_type=None,
+                               limit=None):
+  """ Async version of :any:`datacommons.core.get_property_values`.
+
+  Accepts the same arguments and returns the same :obj:`dict`. Use
+  :code:`asyncio.gather` to fetch several properties concurrently:
+
+  >>> names, types = await asyncio.gather(
+  ...   aget_property_values(dcids, 'name'),
+  ...   aget_property_values(dcids, 'typeOf'))
+  """
+  if limit is None:
+    limit = core.utils._MAX_LIMIT
+  return await _run_blocking(
+    core.get_property_values,
+    dcids,
+    prop,
+    out=out,
+    value_type=value_type,
+    limit=limit)
+
+
+async def aget_triples(dcids, limit=None):
+  """ Async version of :any:`datacommons.core.get_triples`.
+
+  Accepts the same arguments and returns the same :obj:`dict`.
+  """
+  if limit is None:
+    limit = core.utils._MAX_LIMIT
+  return await _run_blocking(core.get_triples, dcids, limit=limit)
@@ -26,10 +26,88 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from collections import defaultdict
+from collections import OrderedDict
+
+import sys
 
 import datacommons.utils as utils
 
+# --------------------------------- HELPERS -----------------------------------
+
+
+# Property labels recur across nodes (most share "typeOf", "name", ...); the
+# pool maps each distinct label to one shared string object so results hold
+# references into a small vocabulary instead of per-node copies.
+_LABEL_POOL = {}
+
+
+def _as_pandas_series(obj):
+  """ Returns obj if it is a pandas Series, otherwise None.
+
+  pandas is not a dependency of this package, and importing it costs both
+  startup time and memory, so this only consults :code:`sys.modules`: a
+  caller can only hand us a Series if pandas is already imported.
+  """
+  pandas = sys.modules.get('pandas')
+  if pandas is not None and isinstance(obj, pandas.Series):
+    return obj
+  return None
+
+
+def _get_node_value(node):
+  """ Returns the dcid of a property value node, its value, or None. """
+  if 'dcid' in node:
+    return node['dcid']
+  return node.get('value')
+
+
+def _node_values(nodes):
+  """ Returns the sorted unique dcids/values of the given payload nodes.
+
+  Most nodes carry zero or one value, in which case the list is already
+  sorted and unique; the set-and-sort pass is reserved for multi-valued
+  results.
+  """
+  values = [
+    v for v in (_get_node_value(node) for node in nodes) if v is not None
+  ]
+  if len(values) > 1:
+    return sorted(set(values))
+  return values
+
+
+def _assemble_triples(triples):
+  """ Builds (subject, predicate, object) tuples from raw triple dicts.
+
+  The object is the triple's objectId when present, otherwise its
+  objectValue; triples carrying neither are dropped.
+  """
+  return [
+    (t['subjectId'], t['predicate'],
+     t['objectId'] if 'objectId' in t else t['objectValue'])
+    for t in triples
+    if 'objectId' in t or 'objectValue' in t
+  ]
+
+
+def _values_as_series(dcids, results):
+  """ Formats property value results as a Series aligned with :code:`dcids`.
+
+  When every node maps to at most one value, cells hold scalars and the
+  Series uses the memory-efficient category dtype; otherwise cells hold
+  lists of values, which callers can flatten with :code:`Series.explode`.
+  """
+  pandas = sys.modules['pandas']
+  values = [results.get(dcid) for dcid in dcids]
+  if all(v is None or len(v) <= 1 for v in values):
+    return pandas.Series(
+      [v[0] if v else None for v in values],
+      index=dcids.index,
+      dtype='category')
+  return pandas.Series(
+    [v if v is not None else [] for v in values], index=dcids.index)
+
+
 # ----------------------------- WRAPPER FUNCTIONS -----------------------------
 
 
@@ -98,17 +176,20 @@ def get_property_labels(dcids, out=True):
   # Generate the GetProperty query and send the request
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
   dcids = list(dcids)
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_property_labels']
-  payload = utils._send_request(url, req_json={'dcids': dcids})
-
-  # Return the results based on the orientation
-  results = {}
-  for dcid in dcids:
-    if out:
-      results[dcid] = payload[dcid]['outLabels']
-    else:
-      results[dcid] = payload[dcid]['inLabels']
-  return results
+  url = utils._API_URL['get_property_labels']
+  payload = utils._send_chunked_request(url, {}, dcids)
+
+  # Return the results based on the orientation. The direction branch is
+  # loop-invariant, so resolve the payload key once; missing dcids default to
+  # an empty list so a partial server response does not raise a KeyError.
+  labels_key = 'outLabels' if out else 'inLabels'
+  return {
+    dcid: [
+      _LABEL_POOL.setdefault(label, label)
+      for label in payload.get(dcid, {}).get(labels_key, [])
+    ]
+    for dcid in dcids
+  }
 
 
 def get_property_values(dcids,
@@ -130,7 +211,11 @@ def get_property_values(dcids,
 
   Returns:
     Returned property values are formatted as a :obj:`dict` from a given dcid
-    to a list of its property values.
+    to a list of its property values. When :code:`dcids` is a
+    :obj:`pandas.Series`, the return value is instead a :obj:`pandas.Series`
+    aligned with the input: category-dtype with one scalar per cell when every
+    node has at most one value, and cells holding lists (flattenable via
+    :code:`Series.explode`) otherwise.
 
   Raises:
     ValueError: If the payload returned by the Data Commons REST API is
@@ -152,49 +237,47 @@ def get_property_values(dcids,
       "geoId/24": ["Maryland"],
     }
   """
+  # Preserve the original input when dcids is a pandas Series so the result
+  # can be returned aligned with it.
+  input_series = _as_pandas_series(dcids)
+
   # Convert the dcids field and format the request to GetPropertyValue
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
-  dcids = list(dcids)
+  # Drop repeated dcids so the request and response scale with the number of
+  # unique nodes. Note that `limit` applies to the deduplicated request.
+  dcids = list(OrderedDict.fromkeys(dcids))
   if out:
     direction = 'out'
   else:
     direction = 'in'
 
   req_json = {
-    'dcids': dcids,
     'property': prop,
     'limit': limit,
     'direction': direction
   }
   if value_type:
     req_json['value_type'] = value_type
+  # Only the dcid/value of each node is ever read from the response, so ask
+  # the server to project the rest away when projection is enabled.
+  if utils._PROJECTION_FIELDS:
+    req_json['fields'] = list(utils._PROJECTION_FIELDS)
+
+  # Send the request, split into concurrent batches when the dcid list
+  # exceeds the batch size.
+  url = utils._API_URL['get_property_values']
+  payload = utils._send_chunked_request(url, req_json, dcids)
+
+  # Build the result in a single pass over dcids, so no intermediate dict of
+  # sets is materialized and every dcid is guaranteed a (possibly empty)
+  # entry.
+  results = {
+    dcid: _node_values(payload.get(dcid, {}).get(direction, []))
+    for dcid in dcids
+  }
 
-  # Send the request
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_property_values']
-  payload = utils._send_request(url, req_json=req_json)
-
-  # Create the result format for when dcids is provided as a list.
-  unique_results = defaultdict(set)
-  for dcid in dcids:
-    # Get the list of nodes based on the direction given.
-    nodes = []
-    if out:
-      if dcid in payload and 'out' in payload[dcid]:
-        nodes = payload[dcid]['out']
-    else:
-       if dcid in payload and 'in' in payload[dcid]:
-          nodes = payload[dcid]['in']
-
-    # Add nodes to unique_results if it is not empty
-    for node in nodes:
-      if 'dcid' in node:
-        unique_results[dcid].add(node['dcid'])
-      elif 'value' in node:
-        unique_results[dcid].add(node['value'])
-
-  # Make sure each dcid is in the results dict, and convert all sets to lists.
-  results = {dcid: sorted(list(unique_results[dcid])) for dcid in dcids}
-
+  if input_series is not None:
+    return _values_as_series(input_series, results)
   return results
 
 
@@ -237,22 +320,12 @@ def get_triples(dcids, limit=utils._MAX_LIMIT):
   """
   # Generate the GetTriple query and send the request.
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
-  dcids = list(dcids)
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_triples']
-  payload = utils._send_request(url, req_json={'dcids': dcids, 'limit': limit})
-
-  # Create a map from dcid to list of triples.
-  results = defaultdict(list)
-  for dcid in dcids:
-    # Make sure each dcid is mapped to an empty list.
-    results[dcid]
-
-    # Add triples as appropriate
-    for t in payload[dcid]:
-      if 'objectId' in t:
-        results[dcid].append(
-          (t['subjectId'], t['predicate'], t['objectId']))
-      elif 'objectValue' in t:
-        results[dcid].append(
-          (t['subjectId'], t['predicate'], t['objectValue']))
-  return dict(results)
+  # Drop repeated dcids so the request and response scale with the number of
+  # unique nodes. Note that `limit` applies to the deduplicated request.
+  dcids = list(OrderedDict.fromkeys(dcids))
+  url = utils._API_URL['get_triples']
+  payload = utils._send_chunked_request(url, {'limit': limit}, dcids)
+
+  # Create a map from dcid to list of triples. Every requested dcid gets an
+  # entry directly, so no defaultdict __missing__ machinery is involved.
+  return {dcid: _assemble_triples(payload[dcid]) for dcid in dcids}
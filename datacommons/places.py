@@ -62,7 +62,7 @@ def get_places_in(dcids, place_type):
   """
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
   dcids = list(dcids)
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_places_in']
+  url = utils._API_URL['get_places_in']
   payload = utils._send_request(url, req_json = {
     'dcids': dcids,
     'place_type': place_type,
@@ -140,45 +140,47 @@ def get_stats(dcids, stats_var, obs_dates='latest', measurement_method=None,
   """
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
   dcids = list(dcids)
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_stats']
-  batches =  -(-len(dcids) // utils._QUERY_BATCH_SIZE)  # Ceil to get # of batches.
+  if not dcids:
+    return {}
+  url = utils._API_URL['get_stats']
+  req_json = {
+    'stats_var': stats_var,
+  }
+  if measurement_method:
+    req_json['measurement_method'] = measurement_method
+  if unit:
+    req_json['unit'] = unit
+  if obs_period:
+    req_json['observation_period'] = obs_period
+  # Batches of _QUERY_BATCH_SIZE places are fetched concurrently and their
+  # payloads merged before filtering, rather than one request at a time.
+  payload = utils._send_chunked_request(url, req_json, dcids,
+                                        dcids_key='place')
   res = {}
-  for i in range(batches):
-    req_json = {
-      'place': dcids[i * utils._QUERY_BATCH_SIZE:(i+1) * utils._QUERY_BATCH_SIZE],
-      'stats_var': stats_var,
-    }
-    if measurement_method:
-      req_json['measurement_method'] = measurement_method
-    if unit:
-      req_json['unit'] = unit
-    if obs_period:
-      req_json['observation_period'] = obs_period
-    payload = utils._send_request(url, req_json)
-    if obs_dates == 'all':
-      res.update(payload)
-    elif obs_dates == 'latest':
-      for geo, stats in payload.items():
-        if not stats:
-          continue
-        time_series = stats.get('data')
-        if not time_series: continue
-        max_date = max(time_series)
-        max_date_stat = time_series[max_date]
-        time_series.clear()
-        time_series[max_date] = max_date_stat
-        res[geo] = stats
-    elif obs_dates:
-      obs_dates = set(obs_dates)
-      for geo, stats in payload.items():
-        if not stats:
-          continue
-        time_series = stats.get('data')
-        if not time_series: continue
-        for date in list(time_series):
-          if date not in obs_dates:
-            time_series.pop(date)
-        res[geo] = stats
+  if obs_dates == 'all':
+    res.update(payload)
+  elif obs_dates == 'latest':
+    for geo, stats in payload.items():
+      if not stats:
+        continue
+      time_series = stats.get('data')
+      if not time_series: continue
+      max_date = max(time_series)
+      stats['data'] = {max_date: time_series[max_date]}
+      res[geo] = stats
+  elif obs_dates:
+    obs_dates = set(obs_dates)
+    for geo, stats in payload.items():
+      if not stats:
+        continue
+      time_series = stats.get('data')
+      if not time_series: continue
+      # Intersect the series with the requested dates in one pass instead of
+      # listing the keys and popping the misses one by one.
+      stats['data'] = {
+        date: stat for date, stat in time_series.items() if date in obs_dates
+      }
+      res[geo] = stats
   return res
 
 
@@ -231,7 +233,7 @@ def get_related_places(dcids, population_type, measured_property,
   """
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
   dcids = list(dcids)
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_related_places']
+  url = utils._API_URL['get_related_places']
   pvs = []
   for p in constraining_properties:
     pvs.append({'property': p, 'value': constraining_properties[p]})
@@ -100,7 +100,7 @@ def get_populations(dcids, population_type, constraining_properties={}):
   dcids = filter(lambda v: v==v, dcids)  # Filter out NaN values
   dcids = list(dcids)
   pv = [{'property': k, 'value': v} for k, v in constraining_properties.items()]
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_populations']
+  url = utils._API_URL['get_populations']
   payload = utils._send_request(url, req_json={
     'dcids': dcids,
     'population_type': population_type,
@@ -191,7 +191,7 @@ def get_observations(dcids,
     req_json['measurement_method'] = measurement_method
 
   # Issue the request to GetObservation
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_observations']
+  url = utils._API_URL['get_observations']
   payload = utils._send_request(url, req_json=req_json)
 
   # Create the results and format it appropriately
@@ -199,13 +199,21 @@ def get_observations(dcids,
     payload, 'observation', must_exist=dcids)
 
   # Drop empty results by calling _flatten_results without default_value, then
-  # coerce the type to float if possible.
+  # coerce the type to float if possible. The coercion (and its exception
+  # machinery for non-numeric values) runs once per distinct value; repeats
+  # are answered from the memo.
   typed_results = {}
+  coerced = {}
   for k, v in _flatten_results(result).items():
+    if v in coerced:
+      typed_results[k] = coerced[v]
+      continue
     try:
-      typed_results[k] = float(v)
+      typed = float(v)
     except ValueError:
-      typed_results[k] = v
+      typed = v
+    coerced[v] = typed
+    typed_results[k] = typed
   return typed_results
 
 
@@ -321,7 +329,7 @@ def get_pop_obs(dcid):
       :code:`medianValue`, :code:`maxValue`, :code:`minValue`, :code:`sumValue`,
       :code:`marginOfError`, :code:`stdError`, :code:`meanStdError`, and others.
   """
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_pop_obs'] + '?dcid={}'.format(dcid)
+  url = utils._API_URL['get_pop_obs'] + '?dcid={}'.format(dcid)
   return utils._send_request(url, compress=True, post=False)
 
 def get_place_obs(
@@ -408,7 +416,7 @@ def get_place_obs(
   """
   # Create the json payload and send it to the REST API.
   pv = [{'property': k, 'value': v} for k, v in constraining_properties.items()]
-  url = utils._API_ROOT + utils._API_ENDPOINTS['get_place_obs']
+  url = utils._API_URL['get_place_obs']
   payload = utils._send_request(url, req_json={
     'place_type': place_type,
     'observation_date': observation_date,
@@ -20,12 +20,85 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from datacommons.utils import _API_ROOT, _API_ENDPOINTS, _ENV_VAR_API_KEY
+from collections import OrderedDict
+
+import gzip
+import sys
+import threading
+
+import datacommons.utils as utils
+
+# Optional streaming JSON parser. SPARQL responses are parsed incrementally
+# with ijson when it is installed, so multi-megabyte result sets are never
+# buffered as one contiguous byte string; the stdlib parser is the fallback.
+# py3 only: the py2 gzip.GzipFile seeks on its fileobj, which urllib
+# responses do not support, so the streamed path would crash on any
+# gzip-encoded response there.
+ijson = None
+if sys.version_info[0] >= 3:
+  try:
+    import ijson
+  except ImportError:
+    pass
+
+# --------------------------------- HELPERS -----------------------------------
+
+
+# Maximum number of parsed query results memoized in memory.
+_ROW_CACHE_SIZE = 128
+
+# LRU of fully parsed result rows keyed by query string, active only while
+# response caching is enabled. Entries hold the canonical row dicts; callers
+# always receive fresh copies so results can be mutated freely.
+_row_cache = OrderedDict()
+_row_cache_lock = threading.Lock()
+
+
+def _row_cache_get(query_string):
+  """ Returns the cached parsed rows for a query string, or None on a miss. """
+  with _row_cache_lock:
+    rows = _row_cache.get(query_string)
+    if rows is not None:
+      # Refresh the key's position in the LRU ordering.
+      if utils._HAS_MOVE_TO_END:
+        _row_cache.move_to_end(query_string)
+      else:
+        del _row_cache[query_string]
+        _row_cache[query_string] = rows
+    return rows
+
+
+def _row_cache_put(query_string, rows):
+  """ Stores parsed rows for a query string, evicting old entries as needed. """
+  with _row_cache_lock:
+    _row_cache[query_string] = rows
+    while len(_row_cache) > _ROW_CACHE_SIZE:
+      _row_cache.popitem(last=False)
+
 
-import json
-import os
-import six.moves.urllib.error
-import six.moves.urllib.request
+def _clear_row_cache():
+  """ Drops all memoized parsed query rows. """
+  with _row_cache_lock:
+    _row_cache.clear()
+
+
+utils._derived_cache_clearers.append(_clear_row_cache)
+
+
+def _read_response_streamed(req_url, req_json):
+  """ Reads a query response by parsing the body incrementally with ijson.
+
+  The wire bytes are consumed as they arrive, so peak memory holds the parsed
+  result rather than the parsed result plus the full raw body.
+  """
+  res = utils._open_request(req_url, req_json=req_json)
+  stream = res
+  if utils._response_is_gzipped(res):
+    stream = gzip.GzipFile(fileobj=res)
+  res_json = {}
+  for key, value in ijson.kvitems(stream, ''):
+    res_json[key] = value
+  return res_json
 
 # ----------------------------- WRAPPER FUNCTIONS -----------------------------
 
@@ -86,44 +159,56 @@ def query(query_string, select=None):
     {"?name": "Maryland", "?dcid": "geoId/24"}
   """
 
-  req_url = _API_ROOT + _API_ENDPOINTS['query']
-  headers = {
-    'Content-Type': 'application/json'
-  }
-  if os.environ.get(_ENV_VAR_API_KEY):
-    headers['x-api-key'] = os.environ[_ENV_VAR_API_KEY]
-
-  req = six.moves.urllib.request.Request(
-    req_url,
-    data=json.dumps({'sparql': query_string}).encode("utf-8"),
-    headers=headers)
-
-  try:
-    res = six.moves.urllib.request.urlopen(req)
-  except six.moves.urllib.error.HTTPError as e:
-    raise ValueError('Response error {}:\n{}'.format(e.code, e.read()))
-
-  # Verify then store the results.
-  res_json = json.loads(res.read())
-
-  # Iterate through the query results
-  header = res_json.get('header')
-  if header is None:
-    raise ValueError('Ill-formatted response: does not contain a header.')
-  result_rows = []
-  for row in res_json.get('rows', []):
-    # Construct the map from query variable to cell value.
-    row_map = {}
-    for idx, cell in enumerate(row.get('cells', [])):
-      if idx > len(header):
-        raise ValueError(
-          'Query error: unexpected cell {}'.format(cell))
-      if 'value' not in cell:
+  # While response caching is enabled, a repeated query is answered from the
+  # memoized parsed rows, skipping both the transport and the row-building
+  # loop. The canonical rows stay in the cache; callers get fresh copies.
+  cache_on = utils._cache_enabled()
+  rows = _row_cache_get(query_string) if cache_on else None
+
+  if rows is None:
+    # Send the request through the shared transport so that all endpoints
+    # reuse a single request path (headers, API key handling and response
+    # decoding). When ijson is installed and the response cache (which needs
+    # the raw body) is off, the response is parsed as it streams in.
+    req_url = utils._API_URL['query']
+    if ijson is not None and not cache_on:
+      res_json = _read_response_streamed(req_url, {'sparql': query_string})
+    else:
+      res_json = utils._send_request(
+        req_url, req_json={'sparql': query_string}, use_payload=False)
+
+    # Iterate through the query results
+    header = res_json.get('header')
+    if header is None:
+      raise ValueError('Ill-formatted response: does not contain a header.')
+    # When the rows are not headed for the cache, apply select while they are
+    # built: rejected rows are dropped immediately instead of accumulating in
+    # an intermediate list that a second pass then filters. The cached path
+    # must keep every row, since the canonical rows serve later selects too.
+    inline_select = select if not cache_on else None
+    max_cells = len(header) + 1
+    rows = []
+    for row in res_json.get('rows', []):
+      cells = row.get('cells', [])
+      # Validate the row once up front instead of checking schema invariants
+      # on every cell, then zip it against the header in a single step rather
+      # than growing a dict one entry at a time.
+      if len(cells) > max_cells:
         raise ValueError(
-          'Query error: cell missing value {}'.format(cell))
-      cell_var = header[idx]
-      row_map[cell_var] = cell['value']
-    # Add the row to the result rows if it is selected
-    if select is None or select(row_map):
-      result_rows.append(row_map)
-  return result_rows
+          'Query error: unexpected cell {}'.format(cells[max_cells]))
+      for cell in cells:
+        if 'value' not in cell:
+          raise ValueError(
+            'Query error: cell missing value {}'.format(cell))
+      row_map = dict(zip(header, (cell['value'] for cell in cells)))
+      if inline_select is None or inline_select(row_map):
+        rows.append(row_map)
+    if cache_on:
+      _row_cache_put(query_string, rows)
+      # The cached rows are canonical; fall through to the copying return.
+    else:
+      return rows
+
+  if select is None:
+    return [dict(row) for row in rows]
+  return [dict(row) for row in rows if select(row)]
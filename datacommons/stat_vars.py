@@ -20,7 +20,6 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-import collections
 import six
 
 import datacommons.utils as utils
@@ -61,7 +60,7 @@ def get_stat_value(place,
       >>> get_stat_value("geoId/05", "Count_Person")
           366331
     """
-    url = utils._API_ROOT + utils._API_ENDPOINTS['get_stat_value']
+    url = utils._API_URL['get_stat_value']
     url += '?place={}&stat_var={}'.format(place, stat_var)
     if date:
         url += '&date={}'.format(date)
@@ -112,7 +111,7 @@ def get_stat_series(place,
       >>> get_stat_series("geoId/05", "Count_Person")
           {"1962":17072000,"2009":36887615,"1929":5531000,"1930":5711000}
     """
-    url = utils._API_ROOT + utils._API_ENDPOINTS['get_stat_series']
+    url = utils._API_URL['get_stat_series']
     url += '?place={}&stat_var={}'.format(place, stat_var)
     if measurement_method:
         url += '&measurement_method={}'.format(measurement_method)
@@ -210,7 +209,7 @@ def get_stat_all(places, stat_vars):
         }
       }
     """
-    url = utils._API_ROOT + utils._API_ENDPOINTS['get_stat_all']
+    url = utils._API_URL['get_stat_all']
     # Cast iterable-like to list.
     places = list(places)
     stat_vars = list(stat_vars)
@@ -243,7 +242,9 @@ def get_stat_all(places, stat_vars):
             raise ValueError("Unexpected response from REST stat/all API.")
 
         # Unnest the REST response for keys that have single-element values.
-        place_statvar_series = collections.defaultdict(dict)
+        # statVarData is already the stat_var_dcid -> series mapping we want,
+        # so adopt it directly instead of rebuilding it entry by entry and
+        # copying the intermediate dict.
         for place_dcid, place in res_json['placeData'].items():
             stat_var_data = place.get('statVarData')
             if not stat_var_data:
@@ -253,8 +254,6 @@ def get_stat_all(places, stat_vars):
                 # error, which will have been caught and passed on in
                 # _send_request.
                 raise ValueError("Unexpected response from REST stat/all API.")
-            for stat_var_dcid, stat_var in stat_var_data.items():
-                place_statvar_series[place_dcid][stat_var_dcid] = stat_var
-        res.update(dict(place_statvar_series))
+            res[place_dcid] = stat_var_data
 
     return res
@@ -0,0 +1,156 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Data Commons Python API unit tests.
+
+Unit tests for the async counterparts of core methods.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import asyncio
+import json
+import unittest
+
+import six.moves.urllib as urllib
+
+import datacommons as dc
+import datacommons.utils as utils
+
+
+def request_mock(*args, **kwargs):
+  """ A mock urlopen in the urllib package. """
+  # Create the mock response object.
+  class MockResponse:
+    def __init__(self, json_data):
+      self.json_data = json_data
+
+    def read(self):
+      return self.json_data
+
+  req = args[0]
+  data = json.loads(req.data)
+
+  # Mock responses for urlopen requests to get_property_values.
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['get_property_values']:
+    if data['dcids'] == ['geoId/06085'] and data['property'] == 'name':
+      res_json = json.dumps({
+        'geoId/06085': {
+          'in': [],
+          'out': [
+            {
+              'value': 'Santa Clara County',
+              'provenanceId': 'dc/sm3m2w3',
+            },
+          ]
+        }
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
+    if data['dcids'] == ['geoId/06085'] and data['property'] == 'typeOf':
+      res_json = json.dumps({
+        'geoId/06085': {
+          'in': [],
+          'out': [
+            {
+              'dcid': 'County',
+              'provenanceId': 'dc/sm3m2w3',
+            },
+          ]
+        }
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
+
+  # Mock responses for urlopen requests to get_property_labels.
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['get_property_labels']:
+    if data['dcids'] == ['geoId/06085']:
+      res_json = json.dumps({
+        'geoId/06085': {
+          'inLabels': ['containedInPlace'],
+          'outLabels': ['name', 'typeOf']
+        }
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
+
+  # Mock responses for urlopen requests to get_triples.
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['get_triples']:
+    if data['dcids'] == ['geoId/06085']:
+      res_json = json.dumps({
+        'geoId/06085': [
+          {
+            'subjectId': 'geoId/06085',
+            'predicate': 'name',
+            'objectValue': 'Santa Clara County'
+          },
+        ]
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
+
+  # Otherwise, return an empty response and a 404.
+  return urllib.error.HTTPError(None, 404, None, None, None)
+
+
+def run_coro(coro):
+  """ Drives a coroutine to completion and returns its result.
+
+  asyncio.run only exists on Python 3.7+, while async_core supports 3.6
+  (its _run_blocking carries a get_event_loop fallback); running on a fresh
+  loop keeps the test floor aligned with the module's.
+  """
+  loop = asyncio.new_event_loop()
+  try:
+    return loop.run_until_complete(coro)
+  finally:
+    loop.close()
+
+
+class TestAsyncCore(unittest.TestCase):
+  """ Unit tests for the async core wrappers. """
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_single_calls(self, urlopen_mock):
+    """ Each coroutine returns the same result as its sync counterpart. """
+    async def fetch():
+      labels = await dc.aget_property_labels(['geoId/06085'])
+      names = await dc.aget_property_values(['geoId/06085'], 'name')
+      triples = await dc.aget_triples(['geoId/06085'])
+      return labels, names, triples
+
+    labels, names, triples = run_coro(fetch())
+    self.assertDictEqual(labels, {'geoId/06085': ['name', 'typeOf']})
+    self.assertDictEqual(names, {'geoId/06085': ['Santa Clara County']})
+    self.assertDictEqual(triples, {
+      'geoId/06085': [('geoId/06085', 'name', 'Santa Clara County')]
+    })
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_gather(self, urlopen_mock):
+    """ Independent calls can be dispatched concurrently with gather. """
+    async def fetch():
+      return await asyncio.gather(
+        dc.aget_property_values(['geoId/06085'], 'name'),
+        dc.aget_property_values(['geoId/06085'], 'typeOf'))
+
+    names, types = run_coro(fetch())
+    self.assertDictEqual(names, {'geoId/06085': ['Santa Clara County']})
+    self.assertDictEqual(types, {'geoId/06085': ['County']})
+
+
+if __name__ == '__main__':
+  unittest.main()
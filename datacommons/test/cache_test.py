@@ -0,0 +1,125 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Data Commons Python API unit tests.
+
+Unit tests for the response cache.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import datacommons as dc
+import datacommons.utils as utils
+
+import json
+import unittest
+import six.moves.urllib as urllib
+
+
+def request_mock(*args, **kwargs):
+  """ A mock urlopen call sent in the urllib package. """
+  # Create the mock response object.
+  class MockResponse:
+    def __init__(self, json_data):
+      self.json_data = json_data
+      # urllib responses yield bytes; py2 str is already bytes.
+      self._body = json_data.encode('utf-8')
+      self._offset = 0
+
+    def read(self, size=-1):
+      # Mirror a urllib response: read() drains the body, read(n) returns
+      # the next chunk (streaming parsers probe with read(0)).
+      if size is None or size < 0:
+        chunk = self._body[self._offset:]
+      else:
+        chunk = self._body[self._offset:self._offset + size]
+      self._offset += len(chunk)
+      return chunk
+
+  req = args[0]
+  data = json.loads(req.data)
+
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['query']:
+    return MockResponse(json.dumps({
+      'header': ['?name'],
+      'rows': [
+        {'cells': [{'value': 'California'}]},
+      ]
+    }))
+
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['get_property_labels']:
+    res_json = json.dumps({
+      dcid: {'inLabels': [], 'outLabels': ['name', 'typeOf']}
+      for dcid in data['dcids']
+    })
+    return MockResponse(json.dumps({'payload': res_json}))
+
+  # Otherwise, return an empty response and a 404.
+  return urllib.error.HTTPError(None, 404, None, None, None)
+
+
+class TestResponseCache(unittest.TestCase):
+  """ Unit tests for set_response_cache_enabled. """
+
+  def setUp(self):
+    dc.set_response_cache_enabled(True)
+
+  def tearDown(self):
+    dc.set_response_cache_enabled(False)
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_repeated_query(self, urlopen_mock):
+    """ A repeated SPARQL query is served from the cache. """
+    query_string = 'SELECT ?name WHERE { ?a name ?name }'
+    first = dc.query(query_string)
+    second = dc.query(query_string)
+    self.assertEqual(first, [{'?name': 'California'}])
+    self.assertEqual(first, second)
+    self.assertEqual(1, urlopen_mock.call_count)
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_repeated_getter(self, urlopen_mock):
+    """ A repeated node getter call is served from the cache, including
+    permutations of the same dcids.
+    """
+    expected = ['name', 'typeOf']
+    labels = dc.get_property_labels(['geoId/06', 'geoId/08'])
+    self.assertDictEqual(labels, {'geoId/06': expected, 'geoId/08': expected})
+    self.assertEqual(1, urlopen_mock.call_count)
+
+    # Identical call and a permutation of it both hit the cache.
+    dc.get_property_labels(['geoId/06', 'geoId/08'])
+    permuted = dc.get_property_labels(['geoId/08', 'geoId/06'])
+    self.assertDictEqual(
+      permuted, {'geoId/06': expected, 'geoId/08': expected})
+    self.assertEqual(1, urlopen_mock.call_count)
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_disabled(self, urlopen_mock):
+    """ Disabling the cache restores one HTTP call per request. """
+    dc.set_response_cache_enabled(False)
+    query_string = 'SELECT ?name WHERE { ?a name ?name }'
+    dc.query(query_string)
+    dc.query(query_string)
+    self.assertEqual(2, urlopen_mock.call_count)
+
+
+if __name__ == '__main__':
+  unittest.main()
@@ -0,0 +1,24 @@
+# Copyright 2017 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Pytest collection configuration.
+
+The async tests use py3-only syntax, so they cannot even be collected on
+Python 2; skip them there instead of crashing collection.
+"""
+
+import sys
+
+collect_ignore = []
+if sys.version_info[0] < 3:
+  collect_ignore.append('async_core_test.py')
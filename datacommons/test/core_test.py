@@ -30,6 +30,7 @@ import six.moves.urllib as urllib
 import datacommons as dc
 import datacommons.utils as utils
 import json
+import pandas as pd
 import unittest
 
 
@@ -305,6 +306,30 @@ def request_mock(*args, **kwargs):
         'dc/MadderDcid': []
       })
       return MockResponse(json.dumps({'payload': res_json}))
+    if data['dcids'] == ['geoId/06085']:
+      # Response for a single-dcid chunk.
+      res_json = json.dumps({
+        'geoId/06085': [
+          {
+            "subjectId": "geoId/06085",
+            "predicate": "name",
+            "objectValue": "Santa Clara County"
+          },
+        ]
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
+    if data['dcids'] == ['geoId/24031']:
+      # Response for a single-dcid chunk.
+      res_json = json.dumps({
+        'geoId/24031': [
+          {
+            "subjectId": "geoId/24031",
+            "predicate": "name",
+            "objectValue": "Montgomery County"
+          },
+        ]
+      })
+      return MockResponse(json.dumps({'payload': res_json}))
     if data['dcids'] == []:
       # Response for sending a request where no dcids are given.
       res_json = json.dumps({})
@@ -424,6 +449,27 @@ class TestGetPropertyValues(unittest.TestCase):
       'dc/p/1234': []
     })
 
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_series(self, urlopen_mock):
+    """ Calling get_property_values with a pandas Series returns an aligned
+    Series.
+    """
+    dcids = pd.Series(['geoId/06085', 'geoId/24031'])
+
+    # Single-valued results come back as a category-dtype Series of scalars.
+    names = dc.get_property_values(dcids, 'name')
+    self.assertEqual(names.dtype.name, 'category')
+    self.assertEqual(
+      list(names), ['Santa Clara County', 'Montgomery County'])
+
+    # Multi-valued results come back as cells holding lists.
+    towns = dc.get_property_values(
+      dcids, 'containedInPlace', out=False, value_type='Town')
+    self.assertEqual(list(towns), [
+      ['geoId/0643294', 'geoId/0644112'],
+      ['geoId/2462850'],
+    ])
+
   @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
   def test_bad_dcids(self, urlopen_mock):
     """ Calling get_property_values with dcids that do not exist returns empty
@@ -518,6 +564,26 @@ class TestGetTriples(unittest.TestCase):
     triples_1 = dc.get_triples([])
     self.assertDictEqual(triples_1, {})
 
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_chunked_request(self, urlopen_mock):
+    """ Dcid lists larger than the batch size are split across requests. """
+    save_batch_size = utils._QUERY_BATCH_SIZE
+    utils._QUERY_BATCH_SIZE = 1
+
+    try:
+      triples = dc.get_triples(['geoId/06085', 'geoId/24031'])
+      self.assertDictEqual(triples, {
+        'geoId/06085': [
+          ('geoId/06085', 'name', 'Santa Clara County'),
+        ],
+        'geoId/24031': [
+          ('geoId/24031', 'name', 'Montgomery County'),
+        ]
+      })
+      self.assertEqual(2, urlopen_mock.call_count)
+    finally:
+      utils._QUERY_BATCH_SIZE = save_batch_size
+
 
 if __name__ == '__main__':
   unittest.main()
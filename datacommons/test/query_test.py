@@ -26,12 +26,20 @@ except ImportError:
     from mock import patch
 
 import datacommons as dc
+import datacommons.query
 import datacommons.utils as utils
 
+import gzip
+import io
 import json
+import sys
 import unittest
 import six.moves.urllib as urllib
 
+# The package re-exports the query *function* under the same name, so the
+# module itself has to be fetched from sys.modules.
+query_module = sys.modules['datacommons.query']
+
 
 def request_mock(*args, **kwargs):
   """ A mock urlopen call sent in the urllib package. """
@@ -39,9 +47,19 @@ def request_mock(*args, **kwargs):
   class MockResponse:
     def __init__(self, json_data):
       self.json_data = json_data
+      # urllib responses yield bytes; py2 str is already bytes.
+      self._body = json_data.encode('utf-8')
+      self._offset = 0
 
-    def read(self):
-      return self.json_data
+    def read(self, size=-1):
+      # Mirror a urllib response: read() drains the body, read(n) returns
+      # the next chunk (streaming parsers probe with read(0)).
+      if size is None or size < 0:
+        chunk = self._body[self._offset:]
+      else:
+        chunk = self._body[self._offset:self._offset + size]
+      self._offset += len(chunk)
+      return chunk
 
   # The accepted query.
   accepted_query = ('''
@@ -118,6 +136,37 @@ WHERE {
   return urllib.error.HTTPError(None, 404, None, None, None)
 
 
+def gzip_request_mock(*args, **kwargs):
+  """ A mock urlopen call returning gzip-encoded query responses. """
+  # Create the mock response object.
+  class GzipMockResponse:
+    def __init__(self, json_data):
+      buf = io.BytesIO()
+      with gzip.GzipFile(fileobj=buf, mode='wb') as f:
+        f.write(json_data.encode('utf-8'))
+      self._body = io.BytesIO(buf.getvalue())
+
+    def info(self):
+      return {'Content-Encoding': 'gzip'}
+
+    def read(self, size=-1):
+      return self._body.read(size)
+
+  req = args[0]
+  data = json.loads(req.data)
+
+  if req.get_full_url() == utils._API_ROOT + utils._API_ENDPOINTS['query']:
+    return GzipMockResponse(json.dumps({
+      'header': ['?name'],
+      'rows': [
+        {'cells': [{'value': 'California'}]},
+      ]
+    }))
+
+  # Otherwise, return an empty response and a 404.
+  return urllib.error.HTTPError(None, 404, None, None, None)
+
+
 class TestQuery(unittest.TestCase):
   """ Unit tests for the Query object. """
 
@@ -172,5 +221,41 @@ WHERE {
     # Issue the query
     self.assertEqual(dc.query(query_string), [])
 
+
+@unittest.skipIf(query_module.ijson is None, 'ijson is not installed')
+class TestStreamedParse(unittest.TestCase):
+  """ Unit tests for the ijson streamed parse of query responses. """
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+  def test_streamed(self, urlopen):
+    """ The streamed parse reconstructs the full response envelope. """
+    query_string = ('''
+SELECT  ?name ?dcid
+WHERE {
+  ?a typeOf Place .
+  ?a name ?name .
+  ?a dcid ("geoId/06" "geoId/21" "geoId/24") .
+  ?a dcid ?dcid
+}
+''')
+    res_json = query_module._read_response_streamed(
+      utils._API_URL['query'], {'sparql': query_string})
+    self.assertEqual(res_json['header'], ['?name', '?dcid'])
+    self.assertEqual(len(res_json['rows']), 3)
+    self.assertEqual(
+      res_json['rows'][0],
+      {'cells': [{'value': 'California'}, {'value': 'geoId/06'}]})
+
+  @patch('six.moves.urllib.request.urlopen', side_effect=gzip_request_mock)
+  def test_streamed_gzip(self, urlopen):
+    """ A gzip-encoded response is inflated while streaming. """
+    res_json = query_module._read_response_streamed(
+      utils._API_URL['query'], {'sparql': 'any query'})
+    self.assertEqual(res_json, {
+      'header': ['?name'],
+      'rows': [{'cells': [{'value': 'California'}]}],
+    })
+
+
 if __name__ == '__main__':
   unittest.main()
@@ -48,9 +48,19 @@ def request_mock(*args, **kwargs):
   class MockResponse:
     def __init__(self, json_data):
       self.json_data = json_data
-
-    def read(self):
-      return self.json_data
+      # urllib responses yield bytes; py2 str is already bytes.
+      self._body = json_data.encode('utf-8')
+      self._offset = 0
+
+    def read(self, size=-1):
+      # Mirror a urllib response: read() drains the body, read(n) returns
+      # the next chunk (streaming parsers probe with read(0)).
+      if size is None or size < 0:
+        chunk = self._body[self._offset:]
+      else:
+        chunk = self._body[self._offset:self._offset + size]
+      self._offset += len(chunk)
+      return chunk
 
   req = args[0]
 
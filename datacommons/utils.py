@@ -20,15 +20,43 @@ from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
-from collections import defaultdict
+from collections import OrderedDict
 
 import base64
+import hashlib
 import json
 import os
+import shelve
 import six.moves.urllib.error
 import six.moves.urllib.request
+import threading
 import zlib
 
+# Used to dispatch chunked requests concurrently. Not available on py2
+# without the `futures` backport; chunks are then sent serially.
+try:
+  from concurrent import futures
+except ImportError:
+  futures = None
+
+# Optional fast JSON codec for response bodies and request encoding. Neither
+# library is a dependency of this package; the stdlib codec is the fallback.
+# _json_dumps always returns utf-8 bytes ready to put on the wire.
+try:
+  import orjson
+  _json_loads = orjson.loads
+  _json_dumps = orjson.dumps
+except ImportError:
+  try:
+    import ujson
+    _json_loads = ujson.loads
+    def _json_dumps(obj):
+      return ujson.dumps(obj).encode('utf-8')
+  except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+      return json.dumps(obj).encode('utf-8')
+
 
 # --------------------------------- CONSTANTS ---------------------------------
 
@@ -54,14 +82,48 @@ _API_ENDPOINTS = {
   'get_stat_all': '/stat/all',
 }
 
+# Full endpoint URLs, resolved once at import time so call sites do not
+# re-concatenate the root and path on every request.
+_API_URL = {
+  endpoint: _API_ROOT + path for endpoint, path in _API_ENDPOINTS.items()
+}
+
 # The default value to limit to
 _MAX_LIMIT = 100
 
 # Batch size for heavyweight queries.
 _QUERY_BATCH_SIZE = 500
 
-# Environment variable names used by the package	
-_ENV_VAR_API_KEY = 'DC_API_KEY'	
+# Maximum number of chunked requests in flight at once.
+_MAX_WORKERS = 16
+
+# Environment variable names used by the package
+_ENV_VAR_API_KEY = 'DC_API_KEY'
+_ENV_VAR_CACHE_DIR = 'DC_CACHE_DIR'
+
+# Maximum number of API responses memoized in memory.
+_MAX_CACHE_SIZE = 4096
+
+# File name of the optional on-disk response cache kept in DC_CACHE_DIR.
+_CACHE_FILE_NAME = 'datacommons_api_cache'
+
+# Request fields holding node lists whose order does not affect the response
+# (responses are dicts keyed by dcid), used to normalize cache keys.
+_ORDER_INSENSITIVE_FIELDS = frozenset(['dcids', 'place', 'places', 'stat_vars'])
+
+# When set to a list of node fields (e.g. ['dcid', 'value']), property value
+# requests ask the server to project returned nodes down to those fields,
+# trimming response bytes. Left unset until the REST API supports projection.
+_PROJECTION_FIELDS = None
+
+# Headers common to every request. urllib copies these into each Request, so
+# the template is shared rather than rebuilt per call; urllib does not
+# negotiate compression on its own, and asking for gzip cuts the bytes on the
+# wire for the large JSON responses this API returns.
+_BASE_HEADERS = {
+  'Content-Type': 'application/json',
+  'Accept-Encoding': 'gzip',
+}
 
 # --------------------------- API UTILITY FUNCTIONS ---------------------------
 
@@ -82,28 +144,156 @@ def set_api_key(api_key):
   os.environ[_ENV_VAR_API_KEY] = api_key
 
 
+def set_response_cache_enabled(enabled=True):
+  """ Enables or disables in-memory caching of REST API responses.
+
+  While enabled, a repeated identical request (including SPARQL queries) is
+  served from a size-bounded in-memory cache instead of re-issuing the HTTP
+  call. Cached entries reflect the graph as of the first fetch; disable the
+  cache to observe live updates. Disabling also drops the in-memory entries.
+
+  An on-disk cache that persists across processes can additionally be enabled
+  by setting the :code:`"DC_CACHE_DIR"` environment variable to a writable
+  directory.
+
+  Args:
+    enabled (:obj:`bool`): Whether responses should be cached in memory.
+  """
+  global _response_cache_enabled
+  _response_cache_enabled = enabled
+  if not enabled:
+    with _response_cache_lock:
+      _response_cache.clear()
+      _close_disk_cache()
+    for clearer in _derived_cache_clearers:
+      clearer()
+
+
 # ------------------------- INTERNAL HELPER FUNCTIONS -------------------------
 
 
-def _send_request(req_url, req_json={}, compress=False, post=True, use_payload=True):
-  """ Sends a POST/GET request to req_url with req_json, default to POST.
+# In-memory LRU of raw response bodies, keyed by a digest of the request.
+# Responses are re-parsed on every hit so callers can freely mutate results.
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+_response_cache_enabled = False
+_disk_cache_handle = None
 
-  Returns:
-    The payload returned by sending the POST/GET request formatted as a dict.
+# Modules keeping derived caches (e.g. parsed query rows) register a clearing
+# callback here so disabling the response cache drops those entries too.
+_derived_cache_clearers = []
+
+# OrderedDict.move_to_end refreshes an LRU slot in one C-level operation, but
+# only exists on py3; py2 callers fall back to delete-and-reinsert.
+_HAS_MOVE_TO_END = hasattr(OrderedDict, 'move_to_end')
+
+
+def _cache_enabled():
+  """ Returns True if response caching is currently active. """
+  return _response_cache_enabled or bool(os.environ.get(_ENV_VAR_CACHE_DIR))
+
+
+def _cache_key(req_url, req_json, post):
+  """ Returns a digest identifying the given request.
+
+  Node-list fields are sorted within the key (never in the request itself),
+  so two calls naming the same dcids in a different order share one cache
+  entry. Requests carrying a limit are keyed verbatim, since the server may
+  truncate those responses order-dependently.
   """
-  headers = {
-    'Content-Type': 'application/json'
-  }
+  if 'limit' not in req_json:
+    req_json = {
+      k: sorted(v)
+      if k in _ORDER_INSENSITIVE_FIELDS and isinstance(v, list) else v
+      for k, v in req_json.items()
+    }
+  canonical = '{}|{}|{}'.format(
+    'POST' if post else 'GET', req_url, json.dumps(req_json, sort_keys=True))
+  return hashlib.md5(canonical.encode('utf-8')).hexdigest()
+
+
+def _disk_cache():
+  """ Lazily opens the on-disk cache if DC_CACHE_DIR is set. """
+  global _disk_cache_handle
+  cache_dir = os.environ.get(_ENV_VAR_CACHE_DIR)
+  if not cache_dir:
+    return None
+  if _disk_cache_handle is None:
+    _disk_cache_handle = shelve.open(
+      os.path.join(cache_dir, _CACHE_FILE_NAME))
+  return _disk_cache_handle
+
+
+def _cache_get(key):
+  """ Returns the cached response body for key, or None on a miss. """
+  with _response_cache_lock:
+    body = _response_cache.get(key)
+    if body is not None:
+      # Refresh the key's position in the LRU ordering.
+      if _HAS_MOVE_TO_END:
+        _response_cache.move_to_end(key)
+      else:
+        del _response_cache[key]
+        _response_cache[key] = body
+      return body
+    disk = _disk_cache()
+    if disk is not None and key in disk:
+      body = disk[key]
+      _response_cache[key] = body
+      # Disk hits fill the in-memory LRU too, so they are subject to the
+      # same size bound as fresh fetches.
+      while len(_response_cache) > _MAX_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+      return body
+  return None
 
-  # Pass along API key if provided
-  if os.environ.get(_ENV_VAR_API_KEY):
-    headers['x-api-key'] = os.environ[_ENV_VAR_API_KEY]
+
+def _cache_put(key, body):
+  """ Stores a response body under key, evicting old entries as needed. """
+  with _response_cache_lock:
+    _response_cache[key] = body
+    while len(_response_cache) > _MAX_CACHE_SIZE:
+      _response_cache.popitem(last=False)
+    disk = _disk_cache()
+    if disk is not None:
+      disk[key] = body
+      disk.sync()
+
+
+def _close_disk_cache():
+  """ Closes the on-disk cache handle, if open. Callers hold the lock. """
+  global _disk_cache_handle
+  if _disk_cache_handle is not None:
+    _disk_cache_handle.close()
+    _disk_cache_handle = None
+
+
+def _response_is_gzipped(res):
+  """ Returns True if the response declares a gzip content encoding. """
+  info = getattr(res, 'info', None)
+  if info is None:
+    return False
+  return (info().get('Content-Encoding') or '').lower() == 'gzip'
+
+
+def _open_request(req_url, req_json={}, post=True):
+  """ Issues the HTTP request and returns the raw (undecoded) response.
+
+  The response body may still be gzip-encoded; callers that read it should
+  consult :code:`_response_is_gzipped`.
+  """
+  # Pass along API key if provided; the constant headers are shared.
+  api_key = os.environ.get(_ENV_VAR_API_KEY)
+  if api_key:
+    headers = dict(_BASE_HEADERS, **{'x-api-key': api_key})
+  else:
+    headers = _BASE_HEADERS
 
   # Send the request and verify the request succeeded
   if post:
     req = six.moves.urllib.request.Request(
       req_url,
-      data=json.dumps(req_json).encode('utf-8'),
+      data=_json_dumps(req_json),
       headers=headers)
   else:
     req = six.moves.urllib.request.Request(req_url, headers=headers)
@@ -117,33 +307,101 @@ def _send_request(req_url, req_json={}, compress=False, post=True, use_payload=T
       raise ValueError(
           'Response error: An HTTP {} code was returned by the REST API. '
           'Printing response\n\n{}'.format(res.code, res.msg))
-  # Get the JSON
-  res_json = json.loads(res.read())
+  return res
+
+
+def _send_request(req_url, req_json={}, compress=False, post=True, use_payload=True):
+  """ Sends a POST/GET request to req_url with req_json, default to POST.
+
+  When response caching is enabled (see :code:`DC_CACHE_DIR`), a repeated
+  request is served from the cache instead of re-issuing the HTTP call.
+
+  Returns:
+    The payload returned by sending the POST/GET request formatted as a dict.
+  """
+  # Serve repeated requests from the response cache when enabled.
+  cache_key = None
+  res_body = None
+  if _cache_enabled():
+    cache_key = _cache_key(req_url, req_json, post)
+    res_body = _cache_get(cache_key)
+
+  if res_body is None:
+    res = _open_request(req_url, req_json=req_json, post=post)
+    res_body = res.read()
+    if _response_is_gzipped(res):
+      res_body = zlib.decompress(res_body, zlib.MAX_WBITS | 32)
+    if cache_key is not None:
+      _cache_put(cache_key, res_body)
+
+  # Get the JSON. Large responses pass through several representations (raw
+  # body, envelope, payload string, parsed payload); drop each one as soon as
+  # the next is built so at most one full copy is held at a time.
+  res_json = _json_loads(res_body)
+  res_body = None
   if not use_payload:
     return res_json
   if 'payload' not in res_json:
     raise ValueError(
         'Response error: Payload not found. Printing response\n\n'
-        '{}'.format(res.text))
+        '{}'.format(res_json))
 
   # If the payload is compressed, decompress and decode it
-  payload = res_json['payload']
+  payload = res_json.pop('payload')
+  res_json = None
   if compress:
     payload = zlib.decompress(
       base64.b64decode(payload), zlib.MAX_WBITS|32)
-  return json.loads(payload)
+  return _json_loads(payload)
+
+
+def _send_chunked_request(req_url, req_json, dcids, dcids_key='dcids'):
+  """ Sends one request per _QUERY_BATCH_SIZE chunk of dcids.
+
+  The payload dicts of all chunks (keyed by dcid) are merged into a single
+  dict. Chunks are dispatched concurrently so total wall time approaches the
+  latency of the slowest chunk rather than the sum of all chunks.
+
+  Args:
+    req_url (:obj:`str`): The request endpoint.
+    req_json (:obj:`dict`): The request body, minus the dcids field.
+    dcids (:obj:`list` of :obj:`str`): The full list of dcids to split.
+    dcids_key (:obj:`str`, optional): The request field carrying the dcids
+      (some endpoints name it differently, e.g. "place").
+  """
+  chunks = [
+    dcids[i:i + _QUERY_BATCH_SIZE]
+    for i in range(0, len(dcids), _QUERY_BATCH_SIZE)
+  ]
+  if len(chunks) <= 1:
+    return _send_request(req_url, req_json=dict(req_json, **{dcids_key: dcids}))
+
+  def send(chunk):
+    return _send_request(req_url, req_json=dict(req_json, **{dcids_key: chunk}))
+
+  if futures is None:
+    partials = [send(chunk) for chunk in chunks]
+  else:
+    executor = futures.ThreadPoolExecutor(
+      max_workers=min(_MAX_WORKERS, len(chunks)))
+    try:
+      partials = list(executor.map(send, chunks))
+    finally:
+      executor.shutdown()
+
+  payload = {}
+  for partial in partials:
+    payload.update(partial)
+  return payload
 
 
 def _format_expand_payload(payload, new_key, must_exist=[]):
   """ Formats expand type payloads into dicts from dcids to lists of values. """
-  # Create the results dictionary from payload
-  results = defaultdict(set)
+  # Seed the dcids that must appear, then group values by dcid in one pass.
+  # Sets exist purely for dedup; sorted() materializes the final lists
+  # directly at the boundary.
+  results = {dcid: set() for dcid in must_exist}
   for entry in payload:
     if 'dcid' in entry and new_key in entry:
-      dcid = entry['dcid']
-      results[dcid].add(entry[new_key])
-
-  # Ensure all dcids in must_exist have some entry in results.
-  for dcid in must_exist:
-    results[dcid]
-  return {k: sorted(list(v)) for k, v in results.items()}
+      results.setdefault(entry['dcid'], set()).add(entry[new_key])
+  return {k: sorted(v) for k, v in results.items()}
@@ -25,9 +25,19 @@ from datacommons_pandas.query import query
 
 # Data Commons Python API
 from datacommons_pandas.core import get_property_labels, get_property_values, get_triples
+
+# Async counterparts of the core node operations (Python 3 only).
+import sys
+if sys.version_info[0] >= 3:
+  from datacommons_pandas.async_core import aget_property_labels, aget_property_values, aget_triples
 from datacommons_pandas.places import get_places_in, get_related_places, get_stats
 from datacommons_pandas.populations import get_populations, get_observations, get_pop_obs, get_place_obs
 from datacommons_pandas.stat_vars import get_stat_value, get_stat_series, get_stat_all
 
 # Other utilities
 from datacommons_pandas.utils import set_api_key
+# The symlinked modules all do `import datacommons.utils`, so the cache flag
+# they consult lives in that module instance; re-export the switch from there.
+# Importing it from datacommons_pandas.utils would flip a parallel copy of the
+# flag that the shared code never reads.
+from datacommons.utils import set_response_cache_enabled
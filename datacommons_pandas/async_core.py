@@ -0,0 +1 @@
+../datacommons/async_core.py
\ No newline at end of file
@@ -103,7 +103,12 @@ def _group_stat_all_by_obs_options(places, stat_vars, keep_series=True):
                                ('scalingFactor',
                                 source_series.get('scalingFactor')))
                 if keep_series:
-                    res[obs_options].append(dict({'place': place}, **series))
+                    # Copy the series once and tack on the place id, rather
+                    # than building a one-key dict and merging it into a
+                    # second fresh dict per row.
+                    row = dict(series)
+                    row['place'] = place
+                    res[obs_options].append(row)
                 else:
                     date = max(series)
                     res[stat_var][obs_options].append({
@@ -164,9 +169,9 @@ def _time_series_pd_input(places, stat_var):
             continue
 
         for row in rows:
-            dates = set(row.keys())
-            dates.remove('place')
-            row_max_date = max(dates)
+            # Find the max date directly; building a set copy of the keys just
+            # to drop 'place' allocates a full set per row for no benefit.
+            row_max_date = max(date for date in row if date != 'place')
             if row_max_date > latest_date_so_far:
                 latest_date_so_far = row_max_date
                 latest_date = [options]
@@ -206,10 +211,17 @@ def build_time_series_dataframe(places, stat_var, desc_col=False):
     if not isinstance(stat_var, six.string_types):
         raise ValueError('Parameter `stat_var` must be a string.')
 
-    df = pd.DataFrame.from_records(_time_series_pd_input(places, stat_var))
-    df.set_index('place', inplace=True)
+    # from_records builds the 'place' index directly, skipping the block
+    # reshuffle a separate set_index pass would do.
+    df = pd.DataFrame.from_records(_time_series_pd_input(places, stat_var),
+                                   index='place')
     df.sort_index(inplace=True)
-    return df[sorted(df.columns, reverse=desc_col)]
+    # Column selection materializes a copy of every block, so only reorder
+    # when the columns are not already in the requested order.
+    columns = sorted(df.columns, reverse=desc_col)
+    if columns == list(df.columns):
+        return df
+    return df[columns]
 
 
 def _multivariate_pd_input(places, stat_vars):
@@ -273,10 +285,11 @@ def _multivariate_pd_input(places, stat_vars):
 
         for row in selected_rows:
             place2cov[row['place']][stat_var] = row['val']
-    return [
-        dict({'place': place}, **multivariates)
-        for place, multivariates in place2cov.items()
-    ]
+    # The per-place dicts are owned by this function, so the place id can be
+    # written into them directly instead of merging each into a new dict.
+    for place, multivariates in place2cov.items():
+        multivariates['place'] = place
+    return list(place2cov.values())
 
 
 def build_multivariate_dataframe(places, stat_vars):
@@ -311,7 +324,9 @@ def build_multivariate_dataframe(places, stat_vars):
         raise ValueError(
             'Parameter `places` and `stat_vars` must be string object or list-like object.'
         )
-    df = pd.DataFrame.from_records(_multivariate_pd_input(places, stat_vars))
-    df.set_index('place', inplace=True)
+    # from_records builds the 'place' index directly, skipping the block
+    # reshuffle a separate set_index pass would do.
+    df = pd.DataFrame.from_records(_multivariate_pd_input(places, stat_vars),
+                                   index='place')
     df.sort_index(inplace=True)
     return df
@@ -0,0 +1,92 @@
+# Copyright 2020 Google Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+""" Data Commons Pandas API unit tests.
+
+Unit tests for the response cache switch exposed via datacommons_pandas.
+The symlinked modules read the flag in the datacommons.utils module
+instance, so the pandas-side re-export must flip that instance and not a
+parallel datacommons_pandas.utils copy.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import datacommons_pandas as dcpd
+import datacommons_pandas.core
+import datacommons.utils as utils
+
+import json
+import unittest
+import six.moves.urllib as urllib
+
+
+def request_mock(*args, **kwargs):
+    """ A mock urlopen call sent in the urllib package. """
+    # Create the mock response object.
+    class MockResponse:
+        def __init__(self, json_data):
+            self.json_data = json_data
+
+        def read(self):
+            return self.json_data
+
+    req = args[0]
+    data = json.loads(req.data)
+
+    if req.get_full_url() == utils._API_URL['get_property_labels']:
+        res_json = json.dumps({
+            dcid: {'inLabels': [], 'outLabels': ['name', 'typeOf']}
+            for dcid in data['dcids']
+        })
+        return MockResponse(json.dumps({'payload': res_json}))
+
+    # Otherwise, return an empty response and a 404.
+    return urllib.error.HTTPError(None, 404, None, None, None)
+
+
+class TestResponseCache(unittest.TestCase):
+    """ Unit tests for set_response_cache_enabled via datacommons_pandas. """
+
+    def setUp(self):
+        dcpd.set_response_cache_enabled(True)
+
+    def tearDown(self):
+        dcpd.set_response_cache_enabled(False)
+
+    def test_flag_reaches_shared_modules(self):
+        """ The switch flips the flag in the module instance the symlinked
+        modules consult. """
+        self.assertTrue(datacommons_pandas.core.utils._cache_enabled())
+        dcpd.set_response_cache_enabled(False)
+        self.assertFalse(datacommons_pandas.core.utils._cache_enabled())
+
+    @patch('six.moves.urllib.request.urlopen', side_effect=request_mock)
+    def test_repeated_getter(self, urlopen_mock):
+        """ A repeated pandas-side getter call is served from the cache. """
+        expected = ['name', 'typeOf']
+        labels = dcpd.get_property_labels(['geoId/06', 'geoId/08'])
+        self.assertDictEqual(
+            labels, {'geoId/06': expected, 'geoId/08': expected})
+        dcpd.get_property_labels(['geoId/06', 'geoId/08'])
+        self.assertEqual(1, urlopen_mock.call_count)
+
+
+if __name__ == '__main__':
+    unittest.main()